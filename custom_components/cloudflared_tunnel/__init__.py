@@ -13,6 +13,10 @@ from .const import (
     CONF_HOSTNAME,
     CONF_PORT,
     CONF_TOKEN,
+    CONF_TOKEN_SECRET,
+    CONF_LOGLEVEL,
+    CONF_EXTRA_ARGS,
+    DEFAULT_LOGLEVEL,
 )
 from .cloudflared import CloudflaredTunnel
 
@@ -20,6 +24,10 @@ _LOGGER = logging.getLogger(__name__)
 
 PLATFORMS = [PLATFORM_SENSOR, PLATFORM_BUTTON]
 
+def get_tunnel_settings(entry: ConfigEntry) -> dict:
+    """Return the entry data with the options flow overrides applied."""
+    return {**entry.data, **entry.options}
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Cloudflared Tunnel from a config entry."""
     if DOMAIN not in hass.data:
@@ -30,9 +38,19 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     hostname = entry.data[CONF_HOSTNAME]
     port = entry.data[CONF_PORT]
-    token = entry.data.get(CONF_TOKEN)  # Optional token
+    # Transport options may be tuned later through the options flow
+    settings = get_tunnel_settings(entry)
+    token = settings.get(CONF_TOKEN)  # Optional token
 
-    tunnel = CloudflaredTunnel(hass, hostname, port, token)
+    tunnel = CloudflaredTunnel(
+        hass,
+        hostname,
+        port,
+        token,
+        token_secret=settings.get(CONF_TOKEN_SECRET),
+        loglevel=settings.get(CONF_LOGLEVEL, DEFAULT_LOGLEVEL),
+        extra_args=settings.get(CONF_EXTRA_ARGS),
+    )
     
     try:
         # Initialize monitoring first
@@ -44,9 +62,14 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     hass.data[DOMAIN][DATA_TUNNELS][entry.entry_id] = tunnel
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    entry.async_on_unload(entry.add_update_listener(async_reload_entry))
     
     return True
 
+async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Reload the tunnel when its options change."""
+    await hass.config_entries.async_reload(entry.entry_id)
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     tunnel = hass.data[DOMAIN][DATA_TUNNELS].get(entry.entry_id)
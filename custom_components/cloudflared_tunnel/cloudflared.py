@@ -3,6 +3,7 @@ import asyncio
 import logging
 import os
 import platform
+import shlex
 import shutil
 import stat
 import urllib.request
@@ -15,7 +16,12 @@ from homeassistant.exceptions import ConfigEntryError
 from homeassistant.helpers.event import async_track_time_interval
 import homeassistant.util.dt as dt_util
 
-from .const import STATUS_RUNNING, STATUS_STOPPED, STATUS_ERROR
+from .const import (
+    STATUS_RUNNING,
+    STATUS_STOPPED,
+    STATUS_ERROR,
+    DEFAULT_LOGLEVEL,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -24,6 +30,7 @@ BIN_PATH = os.path.join(BIN_DIR, "cloudflared")
 
 MAX_RETRIES = 3
 RETRY_DELAY = 2  # seconds
+STARTUP_TIMEOUT = 5  # seconds to wait for the first log line
 
 async def kill_port_process(port: int) -> None:
     """Kill any process using the specified port with force."""
@@ -72,12 +79,24 @@ def safe_download_cloudflared() -> None:
 class CloudflaredTunnel:
     """Class to manage a Cloudflared tunnel."""
 
-    def __init__(self, hass: HomeAssistant, hostname: str, port: int, token: Optional[str] = None) -> None:
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        hostname: str,
+        port: int,
+        token: Optional[str] = None,
+        token_secret: Optional[str] = None,
+        loglevel: str = DEFAULT_LOGLEVEL,
+        extra_args: Optional[str] = None,
+    ) -> None:
         """Initialize the tunnel."""
         self.hass = hass
         self.hostname = hostname
         self.port = port
         self.token = token
+        self.token_secret = token_secret
+        self.loglevel = loglevel
+        self.extra_args = extra_args
         self.process: Optional[asyncio.subprocess.Process] = None
         self._status = STATUS_STOPPED
         self._listeners: list[Callable] = []
@@ -160,6 +179,32 @@ class CloudflaredTunnel:
         for listener in self._listeners:
             self.hass.loop.call_soon_threadsafe(listener)
 
+    def _build_command(self) -> list[str]:
+        """Build the cloudflared access command for this tunnel."""
+        cmd = [
+            BIN_PATH,
+            "access",
+            "tcp",
+            "--url",
+            f"localhost:{self.port}",
+            "--hostname",
+            self.hostname,
+            "--loglevel",
+            self.loglevel,
+        ]
+        if self.token:
+            cmd.extend(["--service-token-id", self.token])
+        if self.extra_args:
+            cmd.extend(shlex.split(self.extra_args))
+        return cmd
+
+    def _build_env(self) -> dict[str, str]:
+        """Build the child environment, keeping the token secret off argv."""
+        env = dict(os.environ)
+        if self.token_secret:
+            env["TUNNEL_SERVICE_TOKEN_SECRET"] = self.token_secret
+        return env
+
     async def start(self) -> None:
         """Start the tunnel."""
         # If already running (by process or by port), do nothing
@@ -172,24 +217,24 @@ class CloudflaredTunnel:
         retries = MAX_RETRIES
         while retries > 0:
             try:
-                cmd = [
-                    BIN_PATH,
-                    "access",
-                    "tcp",
-                    "--url",
-                    f"localhost:{self.port}",
-                    "--hostname",
-                    self.hostname,
-                ]
-                if self.token:
-                    cmd.extend(["--service-token-id", self.token])
+                cmd = self._build_command()
                 self.process = await asyncio.create_subprocess_exec(
                     *cmd,
                     stdout=asyncio.subprocess.PIPE,
                     stderr=asyncio.subprocess.PIPE,
+                    env=self._build_env(),
                 )
-                # Check initial output for any immediate errors
-                error_line = await self.process.stderr.readline()
+                # Check initial output for any immediate errors. Quieter log
+                # levels print nothing on a healthy start, so a timeout with
+                # the process still alive counts as started.
+                try:
+                    error_line = await asyncio.wait_for(
+                        self.process.stderr.readline(), timeout=STARTUP_TIMEOUT
+                    )
+                except asyncio.TimeoutError:
+                    if self.process.returncode is not None:
+                        raise ConfigEntryError("cloudflared exited during startup")
+                    error_line = b""
                 if error_line:
                     error_msg = error_line.decode().strip()
                     if "error" in error_msg.lower():
@@ -223,16 +268,23 @@ class CloudflaredTunnel:
         self._update_status(current_status)
 
     async def _monitor_output(self) -> None:
-        """Monitor the tunnel process output."""
+        """Monitor the tunnel process output.
+
+        cloudflared logs to stderr, so both pipes are drained for the life
+        of the process to keep it from blocking on a full pipe.
+        """
         assert self.process is not None
+        await asyncio.gather(
+            self._monitor_stream(self.process.stdout),
+            self._monitor_stream(self.process.stderr),
+        )
+
+    async def _monitor_stream(self, stream: asyncio.StreamReader) -> None:
+        """Forward one output stream of the tunnel process to the log."""
         while True:
             try:
-                line = await self.process.stdout.readline()
+                line = await stream.readline()
                 if not line:
-                    error_line = await self.process.stderr.readline()
-                    if error_line:
-                        self._error_msg = error_line.decode().strip()
-                        self._update_status(STATUS_ERROR)
                     break
                 log_line = line.decode().strip()
                 _LOGGER.debug("[cloudflared] %s", log_line)
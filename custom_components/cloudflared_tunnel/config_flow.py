@@ -1,9 +1,11 @@
 """Config flow for Cloudflared Tunnel integration."""
 from __future__ import annotations
 
+import shlex
+
 import voluptuous as vol
 from homeassistant import config_entries
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.data_entry_flow import FlowResult
 from typing import Any
 
@@ -12,8 +14,39 @@ from .const import (
     CONF_HOSTNAME,
     CONF_PORT,
     CONF_TOKEN,
+    CONF_TOKEN_SECRET,
+    CONF_LOGLEVEL,
+    CONF_EXTRA_ARGS,
+    LOGLEVELS,
+    DEFAULT_LOGLEVEL,
     TOKEN_DOCS_URL,
 )
+from . import get_tunnel_settings
+
+
+def _validate_extra_args(user_input: dict[str, Any], errors: dict[str, str]) -> None:
+    """Check that the extra arguments can be split like a shell command."""
+    try:
+        shlex.split(user_input.get(CONF_EXTRA_ARGS) or "")
+    except ValueError:
+        errors[CONF_EXTRA_ARGS] = "invalid_extra_args"
+
+
+def _transport_schema(defaults: dict[str, Any]) -> dict:
+    """Return the schema fields for the cloudflared access options."""
+    return {
+        vol.Optional(
+            CONF_TOKEN_SECRET,
+            description={"suggested_value": defaults.get(CONF_TOKEN_SECRET)},
+        ): str,
+        vol.Optional(
+            CONF_LOGLEVEL, default=defaults.get(CONF_LOGLEVEL, DEFAULT_LOGLEVEL)
+        ): vol.In(LOGLEVELS),
+        vol.Optional(
+            CONF_EXTRA_ARGS,
+            description={"suggested_value": defaults.get(CONF_EXTRA_ARGS)},
+        ): str,
+    }
 
 
 @config_entries.HANDLERS.register(DOMAIN)
@@ -22,19 +55,29 @@ class CloudflaredConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     VERSION = 1
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: config_entries.ConfigEntry,
+    ) -> CloudflaredOptionsFlow:
+        """Get the options flow for this handler."""
+        return CloudflaredOptionsFlow(config_entry)
+
     async def async_step_user(self, user_input: dict[str, Any] | None = None) -> FlowResult:
         """Handle the initial step."""
-        errors = {}
+        errors: dict[str, str] = {}
 
         if user_input is not None:
             # Check if we already have an entry with this hostname
             self._async_abort_entries_match({CONF_HOSTNAME: user_input[CONF_HOSTNAME]})
+            _validate_extra_args(user_input, errors)
 
-            # Create the config entry
-            return self.async_create_entry(
-                title=f"Cloudflared Tunnel ({user_input[CONF_HOSTNAME]})",
-                data=user_input,
-            )
+            if not errors:
+                # Create the config entry
+                return self.async_create_entry(
+                    title=f"Cloudflared Tunnel ({user_input[CONF_HOSTNAME]})",
+                    data=user_input,
+                )
 
         return self.async_show_form(
             step_id="user",
@@ -43,10 +86,50 @@ class CloudflaredConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     vol.Required(CONF_HOSTNAME): str,
                     vol.Required(CONF_PORT, default=10300): int,
                     vol.Optional(CONF_TOKEN): str,
+                    **_transport_schema(user_input or {}),
                 }
             ),
             description_placeholders={
                 "token_url": TOKEN_DOCS_URL,
             },
             errors=errors,
-        )
\ No newline at end of file
+        )
+
+
+class CloudflaredOptionsFlow(config_entries.OptionsFlow):
+    """Handle cloudflared access options for an existing tunnel."""
+
+    def __init__(self, config_entry: config_entries.ConfigEntry) -> None:
+        """Initialize the options flow."""
+        self._entry = config_entry
+
+    async def async_step_init(self, user_input: dict[str, Any] | None = None) -> FlowResult:
+        """Manage the tunnel options."""
+        errors: dict[str, str] = {}
+
+        if user_input is not None:
+            _validate_extra_args(user_input, errors)
+            if not errors:
+                # Store cleared fields explicitly so they override the entry data
+                return self.async_create_entry(
+                    title="",
+                    data={
+                        key: user_input.get(key)
+                        for key in (CONF_TOKEN, CONF_TOKEN_SECRET, CONF_LOGLEVEL, CONF_EXTRA_ARGS)
+                    },
+                )
+
+        settings = {**get_tunnel_settings(self._entry), **(user_input or {})}
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema(
+                {
+                    vol.Optional(
+                        CONF_TOKEN,
+                        description={"suggested_value": settings.get(CONF_TOKEN)},
+                    ): str,
+                    **_transport_schema(settings),
+                }
+            ),
+            errors=errors,
+        )
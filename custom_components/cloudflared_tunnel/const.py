@@ -6,6 +6,13 @@ DOMAIN = "cloudflared_tunnel"
 CONF_HOSTNAME = "hostname"
 CONF_PORT = "port"
 CONF_TOKEN = "token"  # JWT token
+CONF_TOKEN_SECRET = "token_secret"
+CONF_LOGLEVEL = "loglevel"
+CONF_EXTRA_ARGS = "extra_args"
+
+# cloudflared access options
+LOGLEVELS = ["debug", "info", "warn", "error", "fatal"]
+DEFAULT_LOGLEVEL = "info"
 
 # Platform names
 PLATFORM_SENSOR = "sensor"
@@ -124,7 +124,8 @@ class CloudflaredStatusSensor(CloudflaredBaseSensor):
             "last_error": self._tunnel._error_msg,
             "port": self._tunnel.port,
             "hostname": self._tunnel.hostname,
-            "protected": bool(self._tunnel.token)
+            "protected": bool(self._tunnel.token),
+            "loglevel": self._tunnel.loglevel,
         }
 
     async def async_will_remove_from_hass(self):
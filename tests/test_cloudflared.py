@@ -0,0 +1,116 @@
+"""Tests for the cloudflared process management."""
+import asyncio
+import logging
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import ConfigEntryError
+
+from custom_components.cloudflared_tunnel.cloudflared import BIN_PATH, CloudflaredTunnel
+from custom_components.cloudflared_tunnel.const import (
+    DEFAULT_LOGLEVEL,
+    STATUS_ERROR,
+    STATUS_RUNNING,
+)
+
+MODULE = "custom_components.cloudflared_tunnel.cloudflared"
+
+
+def _tunnel(**kwargs) -> CloudflaredTunnel:
+    return CloudflaredTunnel(None, "ssh.example.com", 2222, **kwargs)
+
+
+def test_build_command_defaults():
+    assert _tunnel()._build_command() == [
+        BIN_PATH,
+        "access",
+        "tcp",
+        "--url",
+        "localhost:2222",
+        "--hostname",
+        "ssh.example.com",
+        "--loglevel",
+        DEFAULT_LOGLEVEL,
+    ]
+
+
+def test_build_command_token_and_loglevel():
+    cmd = _tunnel(token="abc", loglevel="debug")._build_command()
+    assert cmd[-4:] == ["--loglevel", "debug", "--service-token-id", "abc"]
+
+
+def test_token_secret_kept_off_command_line():
+    tunnel = _tunnel(token="abc", token_secret="s3cret")
+    assert "s3cret" not in tunnel._build_command()
+    assert "--service-token-secret" not in tunnel._build_command()
+    assert tunnel._build_env()["TUNNEL_SERVICE_TOKEN_SECRET"] == "s3cret"
+
+
+def test_env_without_secret():
+    assert "TUNNEL_SERVICE_TOKEN_SECRET" not in _tunnel()._build_env()
+
+
+def test_build_command_extra_args_split():
+    cmd = _tunnel(extra_args="--destination db:5432 --log-directory '/a b'")._build_command()
+    assert cmd[-4:] == ["--destination", "db:5432", "--log-directory", "/a b"]
+
+
+def test_build_command_unbalanced_extra_args():
+    with pytest.raises(ValueError):
+        _tunnel(extra_args='--x "abc')._build_command()
+
+
+def _process(returncode=None) -> SimpleNamespace:
+    """Return a fake cloudflared process with empty output pipes."""
+    return SimpleNamespace(
+        returncode=returncode,
+        stdout=asyncio.StreamReader(),
+        stderr=asyncio.StreamReader(),
+    )
+
+
+async def test_start_without_startup_output(hass: HomeAssistant) -> None:
+    tunnel = CloudflaredTunnel(hass, "ssh.example.com", 2222, loglevel="warn")
+    process = _process()
+
+    with patch(f"{MODULE}.STARTUP_TIMEOUT", 0.01), patch(
+        f"{MODULE}.os.path.exists", return_value=True
+    ), patch(f"{MODULE}.asyncio.create_subprocess_exec", return_value=process):
+        await tunnel.start()
+
+    assert tunnel._status == STATUS_RUNNING
+    process.stdout.feed_eof()
+    process.stderr.feed_eof()
+    await hass.async_block_till_done()
+
+
+async def test_start_process_exits_silently(hass: HomeAssistant) -> None:
+    tunnel = CloudflaredTunnel(hass, "ssh.example.com", 2222, loglevel="warn")
+
+    with patch(f"{MODULE}.STARTUP_TIMEOUT", 0.01), patch(
+        f"{MODULE}.os.path.exists", return_value=True
+    ), patch(
+        f"{MODULE}.asyncio.create_subprocess_exec", return_value=_process(returncode=1)
+    ), pytest.raises(ConfigEntryError):
+        await tunnel.start()
+
+    assert tunnel._status == STATUS_ERROR
+
+
+async def test_monitor_output_drains_stderr(hass: HomeAssistant, caplog) -> None:
+    caplog.set_level(logging.DEBUG, logger=MODULE)
+    tunnel = CloudflaredTunnel(hass, "ssh.example.com", 2222, loglevel="debug")
+    tunnel.process = _process()
+    for i in range(1000):
+        tunnel.process.stderr.feed_data(f"DBG accepted connection {i}\n".encode())
+    tunnel.process.stderr.feed_data(b'ERR error="connection refused" failed to connect to origin\n')
+    tunnel.process.stderr.feed_eof()
+    tunnel.process.stdout.feed_eof()
+
+    await tunnel._monitor_output()
+
+    assert "[cloudflared] DBG accepted connection 999" in caplog.text
+    assert tunnel._status == STATUS_ERROR
+    assert tunnel._error_msg == 'ERR error="connection refused" failed to connect to origin'
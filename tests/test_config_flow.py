@@ -0,0 +1,88 @@
+"""Tests for the Cloudflared Tunnel config and options flows."""
+from unittest.mock import patch
+
+from homeassistant import config_entries
+from homeassistant.core import HomeAssistant
+from homeassistant.data_entry_flow import FlowResultType
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.cloudflared_tunnel.const import (
+    CONF_EXTRA_ARGS,
+    CONF_HOSTNAME,
+    CONF_LOGLEVEL,
+    CONF_PORT,
+    CONF_TOKEN,
+    CONF_TOKEN_SECRET,
+    DOMAIN,
+)
+
+USER_INPUT = {
+    CONF_HOSTNAME: "ssh.example.com",
+    CONF_PORT: 2222,
+    CONF_TOKEN: "abc",
+    CONF_TOKEN_SECRET: "s3cret",
+    CONF_LOGLEVEL: "info",
+}
+
+
+async def test_user_step_creates_entry(hass: HomeAssistant) -> None:
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN, context={"source": config_entries.SOURCE_USER}
+    )
+    assert result["type"] == FlowResultType.FORM
+
+    with patch(
+        "custom_components.cloudflared_tunnel.async_setup_entry", return_value=True
+    ):
+        result = await hass.config_entries.flow.async_configure(
+            result["flow_id"], {**USER_INPUT, CONF_EXTRA_ARGS: "--destination db:5432"}
+        )
+        await hass.async_block_till_done()
+
+    assert result["type"] == FlowResultType.CREATE_ENTRY
+    assert result["data"][CONF_EXTRA_ARGS] == "--destination db:5432"
+
+
+async def test_user_step_invalid_extra_args(hass: HomeAssistant) -> None:
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN, context={"source": config_entries.SOURCE_USER}
+    )
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"], {**USER_INPUT, CONF_EXTRA_ARGS: '--x "abc'}
+    )
+
+    assert result["type"] == FlowResultType.FORM
+    assert result["errors"] == {CONF_EXTRA_ARGS: "invalid_extra_args"}
+
+
+async def test_options_invalid_extra_args(hass: HomeAssistant) -> None:
+    entry = MockConfigEntry(domain=DOMAIN, data=USER_INPUT)
+    entry.add_to_hass(hass)
+
+    result = await hass.config_entries.options.async_init(entry.entry_id)
+    assert result["type"] == FlowResultType.FORM
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"], {CONF_LOGLEVEL: "debug", CONF_EXTRA_ARGS: '--x "abc'}
+    )
+
+    assert result["type"] == FlowResultType.FORM
+    assert result["errors"] == {CONF_EXTRA_ARGS: "invalid_extra_args"}
+    assert entry.options == {}
+
+
+async def test_options_clearing_token_and_secret(hass: HomeAssistant) -> None:
+    entry = MockConfigEntry(domain=DOMAIN, data=USER_INPUT)
+    entry.add_to_hass(hass)
+
+    result = await hass.config_entries.options.async_init(entry.entry_id)
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"], {CONF_LOGLEVEL: "warn"}
+    )
+
+    assert result["type"] == FlowResultType.CREATE_ENTRY
+    assert entry.options == {
+        CONF_TOKEN: None,
+        CONF_TOKEN_SECRET: None,
+        CONF_LOGLEVEL: "warn",
+        CONF_EXTRA_ARGS: None,
+    }
@@ -0,0 +1,76 @@
+"""Tests for the Cloudflared Tunnel setup and settings merge."""
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.cloudflared_tunnel import get_tunnel_settings
+from custom_components.cloudflared_tunnel.cloudflared import CloudflaredTunnel
+from custom_components.cloudflared_tunnel.const import (
+    CONF_EXTRA_ARGS,
+    CONF_HOSTNAME,
+    CONF_LOGLEVEL,
+    CONF_PORT,
+    CONF_TOKEN,
+    CONF_TOKEN_SECRET,
+    DATA_TUNNELS,
+    DOMAIN,
+)
+
+DATA = {
+    CONF_HOSTNAME: "ssh.example.com",
+    CONF_PORT: 2222,
+    CONF_TOKEN: "abc",
+    CONF_LOGLEVEL: "info",
+}
+
+
+def test_settings_without_options():
+    entry = SimpleNamespace(data=DATA, options={})
+    assert get_tunnel_settings(entry) == DATA
+
+
+def test_options_override_data():
+    entry = SimpleNamespace(
+        data=DATA,
+        options={CONF_LOGLEVEL: "debug", CONF_EXTRA_ARGS: "--destination db:5432"},
+    )
+    settings = get_tunnel_settings(entry)
+    assert settings[CONF_LOGLEVEL] == "debug"
+    assert settings[CONF_EXTRA_ARGS] == "--destination db:5432"
+    assert settings[CONF_HOSTNAME] == "ssh.example.com"
+
+
+def test_cleared_option_overrides_data():
+    entry = SimpleNamespace(
+        data=DATA,
+        options={CONF_TOKEN: None, CONF_TOKEN_SECRET: None},
+    )
+    settings = get_tunnel_settings(entry)
+    assert settings[CONF_TOKEN] is None
+    assert settings[CONF_TOKEN_SECRET] is None
+
+
+async def test_options_update_reloads_tunnel(hass: HomeAssistant) -> None:
+    entry = MockConfigEntry(domain=DOMAIN, data=DATA)
+    entry.add_to_hass(hass)
+
+    with patch("custom_components.cloudflared_tunnel.PLATFORMS", []), patch.object(
+        CloudflaredTunnel, "async_init"
+    ), patch.object(CloudflaredTunnel, "start"), patch.object(
+        CloudflaredTunnel, "stop"
+    ) as mock_stop:
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+        assert hass.data[DOMAIN][DATA_TUNNELS][entry.entry_id].loglevel == "info"
+
+        hass.config_entries.async_update_entry(
+            entry, options={CONF_TOKEN: None, CONF_LOGLEVEL: "debug"}
+        )
+        await hass.async_block_till_done()
+
+    assert mock_stop.called
+    tunnel = hass.data[DOMAIN][DATA_TUNNELS][entry.entry_id]
+    assert tunnel.loglevel == "debug"
+    assert tunnel.token is None